@@ -1,10 +1,9 @@
 import json
 import os
-from typing import List
+import threading
+from typing import Dict, List
 from uuid import uuid4
 
-import boto3
-
 from .schemas import Suggestion
 
 
@@ -19,6 +18,31 @@ def _load_env(name: str) -> str:
     return value
 
 
+_clients: Dict[str, object] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(region: str):
+    # boto3's default session is not thread-safe, so clients are built under
+    # a lock; the prewarm thread and request workers can race here.
+    with _clients_lock:
+        client = _clients.get(region)
+        if client is None:
+            # boto3 is imported on first use; it dominates import time otherwise.
+            import boto3
+
+            client = boto3.session.Session().client(
+                "bedrock-agent-runtime", region_name=region
+            )
+            _clients[region] = client
+        return client
+
+
+def prewarm_client() -> None:
+    """Create the Bedrock client ahead of the first analysis request."""
+    _get_client(_load_env("AWS_REGION"))
+
+
 def _read_completion(response) -> str:
     if "completion" in response:
         completion = response["completion"]
@@ -68,7 +92,7 @@ def analyze_slide_text(slide_id: str, text: str) -> List[Suggestion]:
     agent_id = _load_env("BEDROCK_AGENT_ID")
     alias_id = _load_env("BEDROCK_AGENT_ALIAS_ID")
 
-    client = boto3.client("bedrock-agent-runtime", region_name=region)
+    client = _get_client(region)
     input_payload = json.dumps({"slide_id": slide_id, "slide_text": text})
     response = client.invoke_agent(
         agentId=agent_id,
@@ -5,8 +5,10 @@ DATA_DIR = BASE_DIR / "data"
 UPLOAD_DIR = BASE_DIR / "uploads"
 STORAGE_DIR = BASE_DIR / "storage"
 DB_PATH = DATA_DIR / "sermons.db"
+ENV_PATH = BASE_DIR / ".env"
 
-# Ensure directories exist when module is imported.
-DATA_DIR.mkdir(parents=True, exist_ok=True)
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-STORAGE_DIR.mkdir(parents=True, exist_ok=True)
+# Bump when the DDL in db.init_db changes so existing databases are migrated.
+SCHEMA_VERSION = 1
+
+# Directories are created lazily by the code that writes into them so that
+# importing the app stays free of filesystem side effects.
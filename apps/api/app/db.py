@@ -1,13 +1,22 @@
 import sqlite3
 from typing import Generator
 
-from .config import DB_PATH
+from .config import DATA_DIR, DB_PATH, SCHEMA_VERSION
 
 
 def init_db() -> None:
-    """Initialize SQLite schema for storing sermons."""
+    """Initialize SQLite schema for storing sermons.
+
+    The schema version is tracked in ``PRAGMA user_version`` so the DDL only
+    runs once per database; later startups just read the marker.
+    """
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     try:
+        (current_version,) = conn.execute("PRAGMA user_version").fetchone()
+        if current_version == SCHEMA_VERSION:
+            return
+
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS sermons (
@@ -26,6 +35,7 @@ def init_db() -> None:
         conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_sermons_created_at ON sermons(created_at DESC)"
         )
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         conn.commit()
     finally:
         conn.close()
@@ -1,20 +1,37 @@
+import asyncio
 from datetime import datetime
+from itertools import islice
+import logging
+import os
 from pathlib import Path
 import shutil
-from typing import List, Optional
+import threading
+from typing import Iterable, Iterator, List, Optional
 from uuid import uuid4
 
-from fastapi import Depends, FastAPI, File, Form, HTTPException, UploadFile, status
+from fastapi import (
+    Depends,
+    FastAPI,
+    File,
+    Form,
+    HTTPException,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from pptx import Presentation
-from dotenv import load_dotenv
+from fastapi.responses import FileResponse, StreamingResponse
 
-from .bedrock import BedrockAgentError, analyze_slide_text
-from .config import STORAGE_DIR, UPLOAD_DIR
+from .bedrock import BedrockAgentError, analyze_slide_text, prewarm_client
+from .config import ENV_PATH, STORAGE_DIR, UPLOAD_DIR
 from .db import get_db, init_db
+from .scheduler import Priority, get_scheduler
 from .schemas import (
     AnalysisDocument,
+    BulkDecisionsPayload,
+    ReviewDocument,
+    ReviewSlide,
     Sermon,
     SlideAnalysis,
     SlideContent,
@@ -23,10 +40,20 @@ from .schemas import (
     DecisionsDocument,
     Suggestion,
 )
-from .state import init_sermon_state, load_analysis, load_decisions, save_analysis, save_decisions
+from .state import (
+    init_sermon_state,
+    iter_analysis_slides,
+    load_analysis,
+    load_decisions,
+    update_decisions,
+    upsert_slide_analysis,
+)
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 
 app = FastAPI(title="Apologia API", version="0.1.0")
-load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -36,9 +63,32 @@ app.add_middleware(
 )
 
 
+def _load_env_file() -> None:
+    from dotenv import load_dotenv
+
+    load_dotenv(ENV_PATH)
+
+
+def _prewarm_enabled() -> bool:
+    return os.getenv("APOLOGIA_PREWARM", "").lower() in {"1", "true", "yes"}
+
+
+def _prewarm() -> None:
+    """Pay the deferred import and client setup costs off the request path."""
+    try:
+        import pptx  # noqa: F401
+
+        prewarm_client()
+    except Exception:
+        logger.warning("Pre-warming failed; continuing lazily", exc_info=True)
+
+
 @app.on_event("startup")
 def startup_event() -> None:
+    _load_env_file()
     init_db()
+    if _prewarm_enabled():
+        threading.Thread(target=_prewarm, name="apologia-prewarm", daemon=True).start()
 
 
 @app.get("/health")
@@ -119,7 +169,9 @@ def _ensure_sermon_exists(db, sermon_id: str) -> None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
 
 
-def _get_presentation(db, sermon_id: str) -> Presentation:
+def _get_presentation(db, sermon_id: str):
+    from pptx import Presentation
+
     row = db.execute(
         """
         SELECT id, file_path, original_filename
@@ -216,44 +268,122 @@ def list_sermons(db=Depends(get_db)) -> List[Sermon]:
     return [_row_to_sermon(row) for row in rows]
 
 
-@app.get("/sermons/{sermon_id}/slides", response_model=List[SlideContent])
-def list_sermon_slides(sermon_id: str, db=Depends(get_db)) -> List[SlideContent]:
-    presentation = _get_presentation(db, sermon_id)
-    slides = []
+def _accepts_media_type(accept: str, media_type: str) -> bool:
+    """True if ``media_type`` is listed explicitly in ``accept`` with q > 0."""
+    for media_range in accept.split(","):
+        name, *params = (part.strip() for part in media_range.split(";"))
+        if name.lower() != media_type:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            return True
+    return False
+
+
+def _wants_ndjson(request: Request, stream: bool) -> bool:
+    return stream or _accepts_media_type(
+        request.headers.get("accept", ""), NDJSON_MEDIA_TYPE
+    )
+
+
+def _ndjson_response(items: Iterable) -> StreamingResponse:
+    """Serialize models one per line as the client consumes the response."""
+
+    def lines() -> Iterator[str]:
+        for item in items:
+            if hasattr(item, "model_dump_json"):
+                yield item.model_dump_json() + "\n"
+            else:
+                yield item.json() + "\n"
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
+
+
+def _iter_slide_contents(sermon_id: str, presentation) -> Iterator[SlideContent]:
     for index, slide in enumerate(presentation.slides, start=1):
-        slide_id = f"{sermon_id}:{index}"
-        slides.append(
-            SlideContent(
-                slideId=slide_id,
-                slideNumber=index,
-                originalText=_extract_slide_text(slide),
-            )
+        yield SlideContent(
+            slideId=f"{sermon_id}:{index}",
+            slideNumber=index,
+            originalText=_extract_slide_text(slide),
         )
-    return slides
+
+
+@app.get("/sermons/{sermon_id}/slides", response_model=List[SlideContent])
+def list_sermon_slides(
+    sermon_id: str,
+    request: Request,
+    stream: bool = False,
+    db=Depends(get_db),
+):
+    """
+    List slide text. Send ``Accept: application/x-ndjson`` or ``?stream=true``
+    to receive one slide per line as each is extracted.
+    """
+    presentation = _get_presentation(db, sermon_id)
+    slides = _iter_slide_contents(sermon_id, presentation)
+    if _wants_ndjson(request, stream):
+        return _ndjson_response(slides)
+    return list(slides)
+
+
+def _load_slide_text(db, sermon_id: str, slide_number: int) -> str:
+    presentation = _get_presentation(db, sermon_id)
+    try:
+        slide = presentation.slides[slide_number - 1]
+    except IndexError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    return _extract_slide_text(slide)
+
+
+async def _await_analysis(future, request: Request):
+    """Wait for a scheduled analysis, cancelling it if the client goes away."""
+    waiter = asyncio.wrap_future(future)
+    while True:
+        done, _ = await asyncio.wait({waiter}, timeout=0.5)
+        if done:
+            return waiter.result()
+        if await request.is_disconnected():
+            get_scheduler().cancel(future)
+            raise HTTPException(status_code=499, detail="Client disconnected")
 
 
 @app.post(
     "/sermons/{sermon_id}/slides/{slide_number}/analyze",
     response_model=SlideAnalysis,
 )
-def analyze_slide(
-    sermon_id: str, slide_number: int, db=Depends(get_db)
+async def analyze_slide(
+    sermon_id: str,
+    slide_number: int,
+    request: Request,
+    priority: Priority = "interactive",
+    db=Depends(get_db),
 ) -> SlideAnalysis:
+    """
+    Analyze one slide. Calls go through the analysis scheduler: use
+    ``priority=bulk`` when analyzing a whole deck so interactive requests
+    are served first.
+    """
     if slide_number < 1:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid slide number"
         )
 
-    presentation = _get_presentation(db, sermon_id)
-    try:
-        slide = presentation.slides[slide_number - 1]
-    except IndexError:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
-
+    original_text = await run_in_threadpool(
+        _load_slide_text, db, sermon_id, slide_number
+    )
     slide_id = f"{sermon_id}:{slide_number}"
-    original_text = _extract_slide_text(slide)
+    future = get_scheduler().submit(
+        sermon_id, priority, analyze_slide_text, slide_id, original_text
+    )
     try:
-        suggestions = analyze_slide_text(slide_id, original_text)
+        suggestions = await _await_analysis(future, request)
     except (BedrockAgentError, ValueError, KeyError) as exc:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -266,23 +396,33 @@ def analyze_slide(
         suggestions=suggestions,
     )
 
-    init_sermon_state(sermon_id)
-    doc = load_analysis(sermon_id)
-    for idx, existing in enumerate(doc.slides):
-        if existing.slideId == slide_id:
-            doc.slides[idx] = analysis
-            break
-    else:
-        doc.slides.append(analysis)
-    save_analysis(doc)
+    await run_in_threadpool(init_sermon_state, sermon_id)
+    await run_in_threadpool(upsert_slide_analysis, sermon_id, analysis)
 
     return analysis
 
 
+@app.get("/analysis/scheduler")
+def get_analysis_scheduler_metrics() -> dict:
+    """Queue depth, wait times and concurrency of the analysis scheduler."""
+    return get_scheduler().metrics()
+
+
 @app.get("/sermons/{sermon_id}/analysis", response_model=AnalysisDocument)
-def get_sermon_analysis(sermon_id: str, db=Depends(get_db)) -> AnalysisDocument:
+def get_sermon_analysis(
+    sermon_id: str,
+    request: Request,
+    stream: bool = False,
+    db=Depends(get_db),
+):
+    """
+    Return the analysis document, or one ``SlideAnalysis`` per line when
+    NDJSON is requested.
+    """
     _ensure_sermon_exists(db, sermon_id)
     init_sermon_state(sermon_id)
+    if _wants_ndjson(request, stream):
+        return _ndjson_response(iter_analysis_slides(sermon_id))
     return load_analysis(sermon_id)
 
 
@@ -334,16 +474,7 @@ def save_slide_decisions(
         slideNumber=slide_number,
         decisions=payload.decisions,
     )
-
-    doc = load_decisions(sermon_id)
-    doc.updatedAt = datetime.utcnow()
-    for idx, existing in enumerate(doc.slides):
-        if existing.slideId == slide_id:
-            doc.slides[idx] = decision
-            break
-    else:
-        doc.slides.append(decision)
-    save_decisions(doc)
+    update_decisions(sermon_id, [decision])
 
     return decision
 
@@ -355,6 +486,83 @@ def get_sermon_decisions(sermon_id: str, db=Depends(get_db)) -> DecisionsDocumen
     return load_decisions(sermon_id)
 
 
+@app.patch("/sermons/{sermon_id}/decisions", response_model=DecisionsDocument)
+def save_bulk_decisions(
+    sermon_id: str,
+    payload: BulkDecisionsPayload,
+    db=Depends(get_db),
+) -> DecisionsDocument:
+    """
+    Apply decisions for many slides in one write. Nothing is saved if any
+    slide in the payload is invalid.
+    """
+    presentation = _get_presentation(db, sermon_id)
+    slide_count = len(presentation.slides)
+    if any(not 1 <= entry.slideNumber <= slide_count for entry in payload.slides):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid slide number"
+        )
+
+    init_sermon_state(sermon_id)
+
+    decisions = [
+        SlideDecision(
+            slideId=f"{sermon_id}:{entry.slideNumber}",
+            slideNumber=entry.slideNumber,
+            decisions=entry.decisions,
+        )
+        for entry in payload.slides
+    ]
+    return update_decisions(sermon_id, decisions)
+
+
+@app.get("/sermons/{sermon_id}/review", response_model=ReviewDocument)
+def get_sermon_review(
+    sermon_id: str,
+    startSlide: int = 1,
+    endSlide: Optional[int] = None,
+    db=Depends(get_db),
+) -> ReviewDocument:
+    """
+    Return slides joined with their suggestions and decisions, optionally
+    limited to the inclusive range ``startSlide``..``endSlide``.
+    """
+    if startSlide < 1 or (endSlide is not None and endSlide < startSlide):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid slide range"
+        )
+
+    presentation = _get_presentation(db, sermon_id)
+    init_sermon_state(sermon_id)
+    analysis_by_id = {slide.slideId: slide for slide in load_analysis(sermon_id).slides}
+    decisions_by_id = {
+        slide.slideId: slide for slide in load_decisions(sermon_id).slides
+    }
+
+    window = islice(presentation.slides, startSlide - 1, endSlide)
+    slides = []
+    for index, slide in enumerate(window, start=startSlide):
+        slide_id = f"{sermon_id}:{index}"
+        analysis = analysis_by_id.get(slide_id)
+        decision = decisions_by_id.get(slide_id)
+        slides.append(
+            ReviewSlide(
+                slideId=slide_id,
+                slideNumber=index,
+                originalText=_extract_slide_text(slide),
+                analyzed=analysis is not None,
+                suggestions=analysis.suggestions if analysis else [],
+                decisions=decision.decisions if decision else [],
+            )
+        )
+
+    return ReviewDocument(
+        sermonId=sermon_id,
+        totalSlides=len(presentation.slides),
+        slides=slides,
+    )
+
+
 def _output_pptx_path(sermon_id: str) -> Path:
     return STORAGE_DIR / "sermons" / sermon_id / "output.pptx"
 
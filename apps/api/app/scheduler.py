@@ -0,0 +1,206 @@
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+import os
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, List, Literal, Optional
+
+Priority = Literal["interactive", "bulk"]
+
+# Lower index is served first.
+PRIORITIES: List[str] = ["interactive", "bulk"]
+
+
+class _Job:
+    def __init__(
+        self, key: str, priority: str, fn: Callable[..., Any], args: tuple
+    ) -> None:
+        self.key = key
+        self.priority = priority
+        self.fn = fn
+        self.args = args
+        self.future: Future = Future()
+        self.enqueued_at = time.monotonic()
+
+
+class AnalysisScheduler:
+    """Runs analysis calls on a bounded pool of worker threads.
+
+    Jobs are served by priority class first; within a class, keys (sermon
+    ids) take turns so one large deck cannot starve the others. Bulk jobs
+    never occupy the last ``interactive_slots`` workers, so an interactive
+    job does not wait behind a running bulk call. Workers are started on the
+    first submission.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        interactive_slots: Optional[int] = None,
+        wait_samples: int = 1000,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if interactive_slots is None:
+            interactive_slots = min(1, max_concurrency - 1)
+        if not 0 <= interactive_slots < max_concurrency:
+            raise ValueError("interactive_slots must leave at least one worker for bulk jobs")
+        self.max_concurrency = max_concurrency
+        self.interactive_slots = interactive_slots
+        self._cond = threading.Condition()
+        self._queues: Dict[str, "OrderedDict[str, Deque[_Job]]"] = {
+            priority: OrderedDict() for priority in PRIORITIES
+        }
+        self._waits: Dict[str, Deque[float]] = {
+            priority: deque(maxlen=wait_samples) for priority in PRIORITIES
+        }
+        self._running: Dict[str, int] = {priority: 0 for priority in PRIORITIES}
+        self._completed = 0
+        self._cancelled = 0
+        self._workers: List[threading.Thread] = []
+        self._queued: Dict[Future, _Job] = {}
+
+    def submit(self, key: str, priority: Priority, fn: Callable[..., Any], *args) -> Future:
+        if priority not in self._queues:
+            raise ValueError(f"Unknown priority: {priority}")
+        job = _Job(key, priority, fn, args)
+        with self._cond:
+            self._ensure_workers()
+            self._queues[priority].setdefault(key, deque()).append(job)
+            self._queued[job.future] = job
+            self._cond.notify()
+        return job.future
+
+    def cancel(self, future: Future) -> bool:
+        """Cancel a queued job. Running jobs finish but their result is dropped."""
+        with self._cond:
+            if not future.cancel():
+                return False
+            self._cancelled += 1
+            job = self._queued.pop(future, None)
+            if job is not None:
+                queues = self._queues[job.priority]
+                jobs = queues.get(job.key)
+                if jobs is not None:
+                    jobs.remove(job)
+                    if not jobs:
+                        del queues[job.key]
+            return True
+
+    def cancel_key(self, key: str) -> int:
+        """Cancel every queued job for ``key`` (e.g. a sermon being replaced)."""
+        cancelled = 0
+        with self._cond:
+            for queues in self._queues.values():
+                for job in queues.pop(key, ()):
+                    self._queued.pop(job.future, None)
+                    if job.future.cancel():
+                        cancelled += 1
+            self._cancelled += cancelled
+        return cancelled
+
+    def metrics(self) -> dict:
+        with self._cond:
+            queues = {}
+            for priority in PRIORITIES:
+                waits = sorted(self._waits[priority])
+                queues[priority] = {
+                    "depth": sum(
+                        not job.future.cancelled()
+                        for jobs in self._queues[priority].values()
+                        for job in jobs
+                    ),
+                    "keys": len(self._queues[priority]),
+                    "running": self._running[priority],
+                    "waitMsAvg": _ms(sum(waits) / len(waits)) if waits else None,
+                    "waitMsP95": _ms(waits[int(0.95 * (len(waits) - 1))]) if waits else None,
+                }
+            return {
+                "maxConcurrency": self.max_concurrency,
+                "interactiveSlots": self.interactive_slots,
+                "running": sum(self._running.values()),
+                "completed": self._completed,
+                "cancelled": self._cancelled,
+                "queues": queues,
+            }
+
+    def _ensure_workers(self) -> None:
+        while len(self._workers) < self.max_concurrency:
+            worker = threading.Thread(
+                target=self._work,
+                name=f"apologia-analysis-{len(self._workers)}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _has_capacity(self, priority: str) -> bool:
+        if priority == "interactive":
+            return True
+        bulk_limit = self.max_concurrency - self.interactive_slots
+        return self._running[priority] < bulk_limit
+
+    def _next_job(self) -> Optional[tuple]:
+        for priority in PRIORITIES:
+            if not self._has_capacity(priority):
+                continue
+            queues = self._queues[priority]
+            while queues:
+                key, jobs = queues.popitem(last=False)
+                while jobs:
+                    job = jobs.popleft()
+                    self._queued.pop(job.future, None)
+                    # Futures cancelled outside cancel() are skipped without
+                    # costing the key its turn.
+                    if job.future.set_running_or_notify_cancel():
+                        if jobs:
+                            # Rotate the key to the back so other sermons go next.
+                            queues[key] = jobs
+                        return priority, job
+        return None
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                picked = self._next_job()
+                while picked is None:
+                    self._cond.wait()
+                    picked = self._next_job()
+                priority, job = picked
+                self._waits[priority].append(time.monotonic() - job.enqueued_at)
+                self._running[priority] += 1
+            try:
+                job.future.set_result(job.fn(*job.args))
+            except BaseException as exc:
+                job.future.set_exception(exc)
+            finally:
+                with self._cond:
+                    self._running[priority] -= 1
+                    self._completed += 1
+                    # A freed bulk slot may unblock a worker waiting on the cap.
+                    self._cond.notify_all()
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+
+_scheduler: Optional[AnalysisScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> AnalysisScheduler:
+    """Return the process-wide scheduler.
+
+    Sized by APOLOGIA_ANALYSIS_CONCURRENCY, with APOLOGIA_INTERACTIVE_SLOTS
+    workers reserved for interactive jobs.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            concurrency = int(os.getenv("APOLOGIA_ANALYSIS_CONCURRENCY", "4"))
+            slots = os.getenv("APOLOGIA_INTERACTIVE_SLOTS")
+            _scheduler = AnalysisScheduler(
+                concurrency, interactive_slots=int(slots) if slots else None
+            )
+        return _scheduler
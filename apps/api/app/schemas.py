@@ -67,3 +67,27 @@ class DecisionsDocument(BaseModel):
 
 class SlideDecisionPayload(BaseModel):
     decisions: List[SuggestionDecision] = []
+
+
+class SlideDecisionUpdate(BaseModel):
+    slideNumber: int
+    decisions: List[SuggestionDecision] = []
+
+
+class BulkDecisionsPayload(BaseModel):
+    slides: List[SlideDecisionUpdate] = []
+
+
+class ReviewSlide(BaseModel):
+    slideId: str
+    slideNumber: int
+    originalText: str
+    analyzed: bool = False
+    suggestions: List[Suggestion] = []
+    decisions: List[SuggestionDecision] = []
+
+
+class ReviewDocument(BaseModel):
+    sermonId: str
+    totalSlides: int
+    slides: List[ReviewSlide] = []
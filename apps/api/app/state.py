@@ -1,12 +1,20 @@
 from datetime import datetime
+import json
+import os
 from pathlib import Path
-from typing import Type, TypeVar
+import tempfile
+import threading
+from typing import Iterator, List, Type, TypeVar
 
 from .config import STORAGE_DIR
-from .schemas import AnalysisDocument, DecisionsDocument
+from .schemas import AnalysisDocument, DecisionsDocument, SlideAnalysis, SlideDecision
 
 SERMONS_DIR = STORAGE_DIR / "sermons"
 
+# Serialize read-modify-write cycles on the state files within the process.
+_analysis_lock = threading.Lock()
+_decisions_lock = threading.Lock()
+
 T = TypeVar("T", AnalysisDocument, DecisionsDocument)
 
 
@@ -20,6 +28,22 @@ def _model_to_json_str(model) -> str:
     return model.json(indent=2)
 
 
+def _write_atomic(path: Path, text: str) -> None:
+    # A unique temp file per writer, so concurrent writers (threads or worker
+    # processes) never share or clobber each other's partial output.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as handle:
+            handle.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
 def _model_from_json(model_cls: Type[T], raw: str) -> T:
     if hasattr(model_cls, "model_validate_json"):
         return model_cls.model_validate_json(raw)
@@ -67,9 +91,35 @@ def load_analysis(sermon_id: str) -> AnalysisDocument:
     return _model_from_json(AnalysisDocument, raw)
 
 
+def iter_analysis_slides(sermon_id: str) -> Iterator[SlideAnalysis]:
+    """Yield slide analyses one at a time instead of building the document model."""
+    with analysis_path(sermon_id).open() as handle:
+        slides = json.load(handle).get("slides", [])
+    # Pop from the end so each raw slide is released once it has been yielded.
+    slides.reverse()
+    while slides:
+        item = slides.pop()
+        if hasattr(SlideAnalysis, "model_validate"):
+            yield SlideAnalysis.model_validate(item)
+        else:
+            yield SlideAnalysis.parse_obj(item)
+
+
 def save_analysis(analysis: AnalysisDocument) -> None:
     path = analysis_path(analysis.sermonId)
-    path.write_text(_model_to_json_str(analysis))
+    _write_atomic(path, _model_to_json_str(analysis))
+
+
+def upsert_slide_analysis(sermon_id: str, analysis: SlideAnalysis) -> None:
+    with _analysis_lock:
+        doc = load_analysis(sermon_id)
+        for idx, existing in enumerate(doc.slides):
+            if existing.slideId == analysis.slideId:
+                doc.slides[idx] = analysis
+                break
+        else:
+            doc.slides.append(analysis)
+        save_analysis(doc)
 
 
 def load_decisions(sermon_id: str) -> DecisionsDocument:
@@ -79,4 +129,21 @@ def load_decisions(sermon_id: str) -> DecisionsDocument:
 
 def save_decisions(decisions: DecisionsDocument) -> None:
     path = decisions_path(decisions.sermonId)
-    path.write_text(_model_to_json_str(decisions))
+    _write_atomic(path, _model_to_json_str(decisions))
+
+
+def update_decisions(sermon_id: str, slides: List[SlideDecision]) -> DecisionsDocument:
+    """Upsert several slides' decisions with a single load and write."""
+    with _decisions_lock:
+        doc = load_decisions(sermon_id)
+        doc.updatedAt = datetime.utcnow()
+        index_by_id = {existing.slideId: idx for idx, existing in enumerate(doc.slides)}
+        for decision in slides:
+            idx = index_by_id.get(decision.slideId)
+            if idx is None:
+                index_by_id[decision.slideId] = len(doc.slides)
+                doc.slides.append(decision)
+            else:
+                doc.slides[idx] = decision
+        save_decisions(doc)
+        return doc
@@ -0,0 +1,133 @@
+import threading
+
+import pytest
+
+from app.scheduler import AnalysisScheduler
+
+TIMEOUT = 5
+
+
+def _block_workers(scheduler, priority, count, key="bulk-sermon"):
+    """Occupy ``count`` workers with jobs that run until the returned event is set."""
+    release = threading.Event()
+    started = threading.Semaphore(0)
+
+    def hold():
+        started.release()
+        release.wait(TIMEOUT)
+
+    futures = [scheduler.submit(key, priority, hold) for _ in range(count)]
+    return release, started, futures
+
+
+def test_interactive_job_runs_while_bulk_saturates_pool():
+    scheduler = AnalysisScheduler(max_concurrency=2)
+    release, started, futures = _block_workers(scheduler, "bulk", 5)
+    try:
+        assert started.acquire(timeout=TIMEOUT)
+        # Only one bulk job may run; the second worker is reserved.
+        assert not started.acquire(timeout=0.2)
+
+        interactive = scheduler.submit("other-sermon", "interactive", lambda: "done")
+        assert interactive.result(timeout=1) == "done"
+
+        metrics = scheduler.metrics()
+        assert metrics["queues"]["bulk"]["running"] == 1
+        assert metrics["queues"]["bulk"]["depth"] == 4
+    finally:
+        release.set()
+    for future in futures:
+        future.result(timeout=TIMEOUT)
+
+
+def test_bulk_uses_all_workers_when_nothing_is_reserved():
+    scheduler = AnalysisScheduler(max_concurrency=2, interactive_slots=0)
+    release, started, futures = _block_workers(scheduler, "bulk", 2)
+    try:
+        assert started.acquire(timeout=TIMEOUT)
+        assert started.acquire(timeout=TIMEOUT)
+    finally:
+        release.set()
+    for future in futures:
+        future.result(timeout=TIMEOUT)
+
+
+def test_interactive_slots_must_leave_a_bulk_worker():
+    with pytest.raises(ValueError):
+        AnalysisScheduler(max_concurrency=2, interactive_slots=2)
+
+
+def test_sermons_take_turns_within_a_priority():
+    scheduler = AnalysisScheduler(max_concurrency=1)
+    release, started, blockers = _block_workers(scheduler, "bulk", 1, key="blocker")
+    assert started.acquire(timeout=TIMEOUT)
+
+    order = []
+    futures = [scheduler.submit("A", "bulk", order.append, f"A{i}") for i in range(3)]
+    futures += [scheduler.submit("B", "bulk", order.append, f"B{i}") for i in range(2)]
+    release.set()
+    for future in blockers + futures:
+        future.result(timeout=TIMEOUT)
+
+    assert order == ["A0", "B0", "A1", "B1", "A2"]
+
+
+def test_failures_are_reported_on_the_future():
+    scheduler = AnalysisScheduler(max_concurrency=1)
+
+    def fail():
+        raise KeyError("boom")
+
+    with pytest.raises(KeyError):
+        scheduler.submit("A", "interactive", fail).result(timeout=TIMEOUT)
+
+
+def test_cancelled_future_does_not_cost_its_sermon_a_turn():
+    scheduler = AnalysisScheduler(max_concurrency=1)
+    release, started, blockers = _block_workers(scheduler, "bulk", 1, key="blocker")
+    assert started.acquire(timeout=TIMEOUT)
+
+    order = []
+    a_futures = [scheduler.submit("A", "bulk", order.append, f"A{i}") for i in range(3)]
+    b_futures = [scheduler.submit("B", "bulk", order.append, f"B{i}") for i in range(2)]
+    # Cancelled directly on the future, so the job stays queued until picked.
+    assert a_futures[1].cancel()
+    assert scheduler.metrics()["queues"]["bulk"]["depth"] == 4
+
+    release.set()
+    for future in blockers + [a_futures[0], a_futures[2]] + b_futures:
+        future.result(timeout=TIMEOUT)
+
+    assert order == ["A0", "B0", "A2", "B1"]
+    assert scheduler.metrics()["queues"]["bulk"]["depth"] == 0
+
+
+def test_cancel_removes_the_job_from_its_queue():
+    scheduler = AnalysisScheduler(max_concurrency=1)
+    release, started, blockers = _block_workers(scheduler, "bulk", 1, key="blocker")
+    assert started.acquire(timeout=TIMEOUT)
+
+    order = []
+    a_futures = [scheduler.submit("A", "bulk", order.append, f"A{i}") for i in range(3)]
+    b_futures = [scheduler.submit("B", "bulk", order.append, f"B{i}") for i in range(2)]
+    assert scheduler.cancel(a_futures[1])
+    assert scheduler.metrics()["queues"]["bulk"]["depth"] == 4
+
+    release.set()
+    for future in blockers + [a_futures[0], a_futures[2]] + b_futures:
+        future.result(timeout=TIMEOUT)
+
+    assert order == ["A0", "B0", "A2", "B1"]
+
+
+def test_cancel_key_drops_queued_jobs():
+    scheduler = AnalysisScheduler(max_concurrency=1)
+    release, started, blockers = _block_workers(scheduler, "bulk", 1, key="blocker")
+    assert started.acquire(timeout=TIMEOUT)
+
+    futures = [scheduler.submit("A", "bulk", lambda: None) for _ in range(3)]
+    assert scheduler.cancel_key("A") == 3
+    assert all(future.cancelled() for future in futures)
+    assert scheduler.metrics()["queues"]["bulk"]["depth"] == 0
+    release.set()
+    blockers[0].result(timeout=TIMEOUT)
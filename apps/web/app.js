@@ -353,15 +353,16 @@ backBtn.addEventListener("click", backToHome);
 // Load Review Data
 async function loadSermonReview(sermonId) {
   try {
-    const [slides, analysis, decisions] = await Promise.all([
-      apiFetch(`/sermons/${sermonId}/slides`),
-      apiFetch(`/sermons/${sermonId}/analysis`),
-      apiFetch(`/sermons/${sermonId}/decisions`),
-    ]);
-    
-    state.slides = slides;
-    state.analysisBySlideId = mapAnalysis(analysis.slides || []);
-    state.decisionsBySlideId = mapDecisions(decisions.slides || []);
+    const review = await apiFetch(`/sermons/${sermonId}/review`);
+    const slides = review.slides || [];
+
+    state.slides = slides.map(({ slideId, slideNumber, originalText }) => ({
+      slideId,
+      slideNumber,
+      originalText,
+    }));
+    state.analysisBySlideId = mapAnalysis(slides.filter((slide) => slide.analyzed));
+    state.decisionsBySlideId = mapDecisions(slides);
     state.selectedSlideNumber = slides.length ? slides[0].slideNumber : null;
     
     renderSlideList();
@@ -637,7 +638,7 @@ analyzeAllBtn.addEventListener("click", async () => {
   try {
     for (const slide of state.slides) {
       const analysis = await apiFetch(
-        `/sermons/${state.selectedSermonId}/slides/${slide.slideNumber}/analyze`,
+        `/sermons/${state.selectedSermonId}/slides/${slide.slideNumber}/analyze?priority=bulk`,
         { method: "POST" }
       );
       state.analysisBySlideId[analysis.slideId] = analysis;
@@ -661,24 +662,31 @@ saveChangesBtn.addEventListener("click", async () => {
     return;
   }
 
-  const slideId = `${state.selectedSermonId}:${state.selectedSlideNumber}`;
-  const decisionMap = state.decisionsBySlideId[slideId] || {};
   const payload = {
-    decisions: Object.entries(decisionMap)
-      .filter(([, value]) => value.decision)
-      .map(([suggestionId, value]) => ({
-        suggestionId,
-        decision: value.decision,
-        finalText: value.finalText || null,
+    slides: state.slides
+      .filter((slide) =>
+        Object.values(state.decisionsBySlideId[slide.slideId] || {}).some(
+          (value) => value.decision
+        )
+      )
+      .map((slide) => ({
+        slideNumber: slide.slideNumber,
+        decisions: Object.entries(state.decisionsBySlideId[slide.slideId])
+          .filter(([, value]) => value.decision)
+          .map(([suggestionId, value]) => ({
+            suggestionId,
+            decision: value.decision,
+            finalText: value.finalText || null,
+          })),
       })),
   };
 
   reviewStatus.textContent = "Saving decisions...";
   try {
     await apiFetch(
-      `/sermons/${state.selectedSermonId}/slides/${state.selectedSlideNumber}/decisions`,
+      `/sermons/${state.selectedSermonId}/decisions`,
       {
-        method: "POST",
+        method: "PATCH",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify(payload),
       }
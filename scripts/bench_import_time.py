@@ -0,0 +1,71 @@
+"""Import-time budget check for the API.
+
+Measures how long a fresh interpreter takes to import ``app.main`` on top of
+FastAPI itself and fails when that overhead exceeds the budget, or when a
+deferred dependency (boto3, python-pptx, python-dotenv) is imported eagerly.
+
+Usage (from the repo root, with the API requirements installed):
+
+    python scripts/bench_import_time.py --budget-ms 150
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parent.parent / "apps" / "api"
+DEFERRED_MODULES = ("boto3", "botocore", "pptx", "dotenv")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def _measure(module: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=API_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=150.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = statistics.median(_measure("fastapi")["seconds"] for _ in range(args.runs))
+    samples = [_measure("app.main") for _ in range(args.runs)]
+    app_time = statistics.median(sample["seconds"] for sample in samples)
+    overhead_ms = (app_time - baseline) * 1000
+
+    print(f"fastapi import:  {baseline * 1000:8.1f} ms")
+    print(f"app.main import: {app_time * 1000:8.1f} ms")
+    print(f"app overhead:    {overhead_ms:8.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    eager = sorted(
+        {name.split(".")[0] for name in samples[0]["modules"]} & set(DEFERRED_MODULES)
+    )
+    if eager:
+        print(f"FAIL: deferred modules imported eagerly: {', '.join(eager)}")
+        failed = True
+    if overhead_ms > args.budget_ms:
+        print("FAIL: import-time budget exceeded")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())